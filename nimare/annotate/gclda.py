@@ -207,9 +207,9 @@ class GCLDAModel(NiMAREBase):
         self.data["wtoken_word_idx"] = widx_df["widx"].tolist()
 
         # Import all peak-indices into lists
-        coordinates_df["docidx"] = coordinates_df["id"].astype(str).map(docidx_mapper)
+        # The categorical codes are each ID's position in ids, as in docidx_mapper.
+        coordinates_df["docidx"] = pd.Categorical(coordinates_df["id"], categories=ids).codes
         coordinates_df = coordinates_df[["docidx", "x", "y", "z"]]
-        coordinates_df["docidx"] = coordinates_df["docidx"].astype(int)
 
         # List of document-indices for peak-tokens x
         self.data["ptoken_doc_idx"] = coordinates_df["docidx"].tolist()
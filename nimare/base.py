@@ -160,6 +160,11 @@ class NiMAREBase(metaclass=ABCMeta):
     def save(self, filename, compress=True):
         """Pickle the class instance to the provided file.
 
+        .. versionchanged:: 0.0.13
+
+            Compress with gzip level 6 (zlib's default) instead of 9, which is several times
+            faster for a modest increase in file size.
+
         Parameters
         ----------
         filename : :obj:`str`
@@ -169,7 +174,7 @@ class NiMAREBase(metaclass=ABCMeta):
             uncompressed version will be saved. Default = True.
         """
         if compress:
-            with gzip.GzipFile(filename, "wb") as file_object:
+            with gzip.GzipFile(filename, "wb", compresslevel=6) as file_object:
                 pickle.dump(self, file_object)
         else:
             with open(filename, "wb") as file_object:
@@ -328,9 +328,8 @@ class Dataset(NiMAREBase):
         for attribute in ("annotations", "coordinates", "images", "metadata", "texts"):
             df1 = getattr(self, attribute)
             df2 = getattr(right, attribute)
-            new_df = df1.append(df2, ignore_index=True, sort=False)
-            new_df.sort_values(by="id", inplace=True)
-            new_df.reset_index(drop=True, inplace=True)
+            new_df = pd.concat([df1, df2], ignore_index=True, sort=False)
+            new_df.sort_values(by="id", inplace=True, ignore_index=True)
             new_df = new_df.where(~new_df.isna(), None)
             setattr(new_dset, attribute, new_df)
 
@@ -393,32 +392,27 @@ class Dataset(NiMAREBase):
         """
         results = {}
         results["id"] = self.ids
-        keep_idx = np.arange(len(self.ids), dtype=int)
+        keep = np.ones(len(self.ids), dtype=bool)
         for k, vals in dict_.items():
             if vals[0] == "image":
                 temp = self.get_images(imtype=vals[1])
             elif vals[0] == "metadata":
                 temp = self.get_metadata(field=vals[1])
-            elif vals[0] == "coordinates":
-                dset_coord_groupby_id = dict(iter(self.coordinates.groupby("id")))
-                temp = [
-                    dset_coord_groupby_id[id_] if id_ in dset_coord_groupby_id.keys() else None
-                    for id_ in self.ids
-                ]
-            elif vals[0] == "annotations":
-                dset_annot_groupby_id = dict(iter(self.annotations.groupby("id")))
-                temp = [
-                    dset_annot_groupby_id[id_] if id_ in dset_annot_groupby_id.keys() else None
-                    for id_ in self.ids
-                ]
+            elif vals[0] in ("coordinates", "annotations"):
+                # Only the set of IDs with rows is needed here.
+                # The rows themselves are selected once, after all fields are checked.
+                temp = getattr(self, vals[0])
             else:
                 raise ValueError(f"Input '{vals[0]}' not understood.")
 
             results[k] = temp
-            temp_keep_idx = np.where([t is not None for t in temp])[0]
-            keep_idx = np.intersect1d(keep_idx, temp_keep_idx)
+            if vals[0] in ("coordinates", "annotations"):
+                keep &= np.isin(self.ids, temp["id"].unique())
+            else:
+                keep &= np.array([t is not None for t in temp], dtype=bool)
 
         # reduce
+        keep_idx = np.where(keep)[0]
         if drop_invalid and (len(keep_idx) != len(self.ids)):
             LGR.info(f"Retaining {len(keep_idx)}/{len(self.ids)} studies")
         elif len(keep_idx) != len(self.ids):
@@ -428,10 +422,13 @@ class Dataset(NiMAREBase):
                 "set `drop_invalid` to True."
             )
 
+        keep_ids = self.ids[keep_idx]
         for k in results:
-            results[k] = [results[k][i] for i in keep_idx]
             if dict_.get(k, [None])[0] in ("coordinates", "annotations"):
-                results[k] = pd.concat(results[k])
+                df = results[k]
+                results[k] = df.loc[df["id"].isin(keep_ids)].copy()
+            else:
+                results[k] = [results[k][i] for i in keep_idx]
 
         return results
 
@@ -642,19 +639,20 @@ class Dataset(NiMAREBase):
         found_ids : :obj:`list`
             A list of IDs from the Dataset with at least one focus in the mask.
         """
-        from scipy.spatial.distance import cdist
-
         mask = load_niimg(mask)
 
         dset_mask = self.masker.mask_img
         if not np.array_equal(dset_mask.affine, mask.affine):
             LGR.warning("Mask affine does not match Dataset affine. Assuming same space.")
 
+        # Look up each coordinate's voxel in the mask directly,
+        # rather than comparing every coordinate against every mask voxel.
+        mask_data = mask.get_fdata()
         dset_ijk = mm2vox(self.coordinates[["x", "y", "z"]].values, mask.affine)
-        mask_ijk = np.vstack(np.where(mask.get_fdata())).T
-        distances = cdist(mask_ijk, dset_ijk)
-        distances = np.any(distances == 0, axis=0)
-        found_ids = list(self.coordinates.loc[distances, "id"].unique())
+        in_bounds = np.all((dset_ijk >= 0) & (dset_ijk < mask_data.shape[:3]), axis=1)
+        in_mask = np.zeros(dset_ijk.shape[0], dtype=bool)
+        in_mask[in_bounds] = mask_data[tuple(dset_ijk[in_bounds].T)] != 0
+        found_ids = list(self.coordinates.loc[in_mask, "id"].unique())
         return found_ids
 
     def get_studies_by_coordinate(self, xyz, r=20):
@@ -673,11 +671,15 @@ class Dataset(NiMAREBase):
             A list of IDs from the Dataset with at least one focus within
             radius r of requested coordinates.
         """
-        from scipy.spatial.distance import cdist
+        from scipy.spatial import cKDTree
 
         xyz = np.array(xyz)
         assert xyz.shape[1] == 3 and xyz.ndim == 2
-        distances = cdist(xyz, self.coordinates[["x", "y", "z"]].values)
-        distances = np.any(distances <= r, axis=0)
-        found_ids = list(self.coordinates.loc[distances, "id"].unique())
+        # Query a KD-tree of the Dataset's coordinates instead of building the full
+        # (n_requested x n_coordinates) distance matrix.
+        tree = cKDTree(self.coordinates[["x", "y", "z"]].values)
+        found_idx = np.unique(np.concatenate(tree.query_ball_point(xyz, r)).astype(int))
+        in_radius = np.zeros(self.coordinates.shape[0], dtype=bool)
+        in_radius[found_idx] = True
+        found_ids = list(self.coordinates.loc[in_radius, "id"].unique())
         return found_ids
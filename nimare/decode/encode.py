@@ -83,20 +83,24 @@ def gclda_encode(model, text, out_file=None, topic_priors=None, prior_weight=1.0
         text = " ".join(text)
 
     # Assume that words in vocabulary are underscore-separated.
-    # Convert to space-separation for vectorization of input string.
+    # Convert both the vocabulary and the input string to space-separation for vectorization,
+    # so that either spelling of a multi-word term in the text matches it.
+    text = text.replace("_", " ")
     vocabulary = [term.replace("_", " ") for term in model.vocabulary]
-    max_len = max([len(term.split(" ")) for term in vocabulary])
-    vectorizer = CountVectorizer(vocabulary=model.vocabulary, ngram_range=(1, max_len))
-    word_counts = np.squeeze(vectorizer.fit_transform([text]).toarray())
-    keep_idx = np.where(word_counts > 0)[0]
-    text_counts = word_counts[keep_idx]
+    # Terms such as "a_b" and "a b" collapse to the same n-gram, which CountVectorizer rejects,
+    # so count each unique n-gram once and map the counts back onto the model's vocabulary.
+    unique_terms, term_idx = np.unique(vocabulary, return_inverse=True)
+    max_len = max([len(term.split(" ")) for term in unique_terms])
+    vectorizer = CountVectorizer(vocabulary=unique_terms.tolist(), ngram_range=(1, max_len))
+    # Sparse (1 x n_words) matrix
+    word_counts = vectorizer.fit_transform([text])[:, term_idx.ravel()]
 
     # n_topics_per_word_token = np.sum(model.n_word_tokens_word_by_topic, axis=1)
     # p_topic_g_word = model.n_word_tokens_word_by_topic / n_topics_per_word_token[:, None]
     # p_topic_g_word = np.nan_to_num(p_topic_g_word, 0)
-    p_topic_g_text = model.p_topic_g_word_[keep_idx]  # p(T|W) for words in text only
-    prod = p_topic_g_text * text_counts[:, None]  # Multiply p(T|W) by words in text
-    topic_weights = np.sum(prod, axis=0)  # Sum across words
+    # Multiply p(T|W) by word counts and sum across words in one sparse product,
+    # which only touches the words found in the text
+    topic_weights = np.asarray(word_counts @ model.p_topic_g_word_).ravel()
     if topic_priors is not None:
         weighted_priors = weight_priors(topic_priors, prior_weight)
         topic_weights *= weighted_priors
@@ -20,6 +20,7 @@ from nimare.extract.utils import (
     _get_concept_reltype,
     _get_dataset_dir,
     _longify,
+    _to_chunks,
 )
 from nimare.utils import get_resource_path
 
@@ -438,8 +439,7 @@ def download_abstracts(dataset, email):
     Entrez.email = email
 
     if isinstance(dataset, Dataset):
-        pmids = dataset.texts["study_id"].astype(str).tolist()
-        pmids = sorted(list(set(pmids)))
+        pmids = np.unique(dataset.texts["study_id"].to_numpy(dtype=str)).tolist()
     elif isinstance(dataset, list):
         pmids = [str(pmid) for pmid in dataset]
     else:
@@ -447,9 +447,10 @@ def download_abstracts(dataset, email):
 
     records = []
     # PubMed only allows you to search ~1000 at a time. I chose 900 to be safe.
-    chunks = [pmids[x : x + 900] for x in range(0, len(pmids), 900)]
-    for i, chunk in enumerate(chunks):
-        LGR.info(f"Downloading chunk {i + 1} of {len(chunks)}")
+    chunk_size = 900
+    n_chunks = int(np.ceil(len(pmids) / chunk_size))
+    for i, chunk in enumerate(_to_chunks(pmids, chunk_size)):
+        LGR.info(f"Downloading chunk {i + 1} of {n_chunks}")
         h = Entrez.efetch(db="pubmed", id=chunk, rettype="medline", retmode="text")
         records += list(Medline.parse(h))
 
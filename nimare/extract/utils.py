@@ -4,10 +4,10 @@ from __future__ import division
 import logging
 import os
 import os.path as op
+from itertools import islice
 
 import numpy as np
 import pandas as pd
-import requests
 from fuzzywuzzy import fuzz
 
 from nimare.utils import _uk_to_us
@@ -163,6 +163,8 @@ def _download_zipped_file(url, filename=None):
     .. versionadded:: 0.0.2
 
     """
+    import requests
+
     if filename is None:
         data_dir = op.abspath(op.getcwd())
         filename = op.join(data_dir, url.split("/")[-1])
@@ -175,6 +177,21 @@ def _download_zipped_file(url, filename=None):
     return filename
 
 
+def _to_chunks(seq, n):
+    """Yield successive lists of up to ``n`` items from an iterable.
+
+    .. versionadded:: 0.0.13
+
+    Items are consumed lazily, so slices of the input are never materialized up front.
+    """
+    iterator = iter(seq)
+    while True:
+        chunk = list(islice(iterator, n))
+        if not chunk:
+            return
+        yield chunk
+
+
 def _longify(df):
     """Expand comma-separated lists of aliases in DataFrame into separate rows.
 
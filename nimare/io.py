@@ -1,6 +1,7 @@
 """Input/Output operations."""
 import json
 import logging
+import multiprocessing as mp
 import re
 from collections import Counter
 from itertools import groupby
@@ -9,7 +10,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import requests
+from joblib import Parallel, delayed
 from scipy import sparse
 
 from nimare.dataset import Dataset
@@ -76,12 +77,16 @@ def convert_neurosynth_to_dict(
     Starting in version 0.0.10, this function operates on the new Neurosynth/NeuroQuery file
     format. Old code using this function **will not work** with the new version.
     """
-    coords_df = pd.read_table(coordinates_file)
-    metadata_df = pd.read_table(metadata_file)
+    # Only parse the coordinate columns that are used, with fixed dtypes,
+    # so pandas can skip type inference on the (large) coordinates table.
+    coords_df = pd.read_table(
+        coordinates_file,
+        usecols=["id", "x", "y", "z"],
+        dtype={"id": str, "x": float, "y": float, "z": float},
+    )
+    metadata_df = pd.read_table(metadata_file, dtype={"id": str})
     assert metadata_df["id"].is_unique, "Metadata file must have one row per ID."
 
-    coords_df["id"] = coords_df["id"].astype(str)
-    metadata_df["id"] = metadata_df["id"].astype(str)
     metadata_df = metadata_df.set_index("id", drop=False)
     ids = metadata_df["id"].tolist()
 
@@ -133,11 +138,14 @@ def convert_neurosynth_to_dict(
     x = coords_df["x"].values
     y = coords_df["y"].values
     z = coords_df["z"].values
+    # Group row positions by ID in a single pass, instead of scanning the full column per study
+    coord_inds_by_id = coords_df.groupby("id", sort=False).indices
+    no_coords = np.array([], dtype=int)
 
     dset_dict = {}
 
     for sid, study_metadata in metadata_df.iterrows():
-        coord_inds = np.where(coords_df["id"].values == sid)[0]
+        coord_inds = coord_inds_by_id.get(sid, no_coords)
         study_dict = {}
         study_dict["metadata"] = {}
         study_dict["metadata"]["authors"] = study_metadata.get("authors", "n/a")
@@ -435,10 +443,15 @@ def convert_neurovault_to_dataset(
     contrasts,
     img_dir=None,
     map_type_conversion=None,
+    n_cores=1,
     **dset_kwargs,
 ):
     """Convert a group of NeuroVault collections into a NiMARE Dataset.
 
+    .. versionchanged:: 0.0.13
+
+        * Add ``n_cores`` parameter to fetch collection metadata in parallel.
+
     .. versionadded:: 0.0.8
 
     Parameters
@@ -468,6 +481,11 @@ def convert_neurovault_to_dataset(
         Dictionary whose keys are what you expect the `map_type` name to
         be in neurovault and the values are the name of the respective
         statistic map in a nimare dataset. Default = None.
+    n_cores : :obj:`int`, optional
+        Number of collections for which to request metadata from NeuroVault concurrently.
+        If <=0, defaults to using all available cores. Since the requests are I/O-bound and
+        run in threads, larger values are used as-is rather than capped at the number of
+        available cores. Default is 1.
     **dset_kwargs : keyword arguments passed to Dataset
         Keyword arguments to pass in when creating the Dataset object.
         see :obj:`~nimare.dataset.Dataset` for details.
@@ -477,6 +495,8 @@ def convert_neurovault_to_dataset(
     :obj:`~nimare.dataset.Dataset`
         Dataset object containing experiment information from neurovault.
     """
+    import requests
+
     img_dir = Path(_get_dataset_dir("_".join(contrasts.keys()), data_dir=img_dir))
 
     if map_type_conversion is None:
@@ -485,18 +505,25 @@ def convert_neurovault_to_dataset(
     if not isinstance(collection_ids, dict):
         collection_ids = {nv_coll: nv_coll for nv_coll in collection_ids}
 
+    # Requests are I/O-bound, so threads are enough to overlap them, and there is no reason
+    # to cap their number at the core count as _check_ncores does.
+    if n_cores <= 0:
+        n_cores = mp.cpu_count()
+
+    collection_images = Parallel(n_jobs=n_cores, prefer="threads")(
+        delayed(_fetch_neurovault_collection)(nv_coll) for nv_coll in collection_ids.values()
+    )
+
     dataset_dict = {}
-    for coll_name, nv_coll in collection_ids.items():
-
-        nv_url = f"https://neurovault.org/api/collections/{nv_coll}/images/?format=json"
-        images = requests.get(nv_url).json()
-        if "Not found" in images.get("detail", ""):
-            raise ValueError(
-                f"Collection {nv_coll} not found. "
-                "Three likely causes are (1) the collection doesn't exist, "
-                "(2) the collection is private, or "
-                "(3) the provided ID corresponds to an image instead of a collection."
-            )
+    for (coll_name, nv_coll), images in zip(collection_ids.items(), collection_images):
+        # These checks do not depend on the contrast, so apply them once per collection,
+        # leaving only the (more expensive) name matching for each contrast.
+        group_images = [
+            img_dict
+            for img_dict in images["results"]
+            if img_dict["analysis_level"] == "group"
+            and img_dict["map_type"] in map_type_conversion
+        ]
 
         dataset_dict[f"study-{coll_name}"] = {"contrasts": {}}
         for contrast_name, contrast_regex in contrasts.items():
@@ -511,12 +538,8 @@ def convert_neurovault_to_dataset(
 
             sample_sizes = []
             no_images = True
-            for img_dict in images["results"]:
-                if not (
-                    re.match(contrast_regex, img_dict["name"])
-                    and img_dict["map_type"] in map_type_conversion
-                    and img_dict["analysis_level"] == "group"
-                ):
+            for img_dict in group_images:
+                if not re.match(contrast_regex, img_dict["name"]):
                     continue
 
                 no_images = False
@@ -566,6 +589,23 @@ def convert_neurovault_to_dataset(
     return dataset
 
 
+def _fetch_neurovault_collection(nv_coll):
+    """Fetch the image metadata for a NeuroVault collection."""
+    import requests
+
+    nv_url = f"https://neurovault.org/api/collections/{nv_coll}/images/?format=json"
+    images = requests.get(nv_url).json()
+    if "Not found" in images.get("detail", ""):
+        raise ValueError(
+            f"Collection {nv_coll} not found. "
+            "Three likely causes are (1) the collection doesn't exist, "
+            "(2) the collection is private, or "
+            "(3) the provided ID corresponds to an image instead of a collection."
+        )
+
+    return images
+
+
 def _resolve_sample_size(sample_sizes):
     """Choose modal sample_size if there are multiple sample_sizes to choose from."""
     sample_size_counts = Counter(sample_sizes)
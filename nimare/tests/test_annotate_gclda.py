@@ -1,4 +1,6 @@
 """Test nimare.annotate.gclda (GCLDA)."""
+from types import SimpleNamespace
+
 import nibabel as nib
 import numpy as np
 import pandas as pd
@@ -83,3 +85,35 @@ def test_gclda_asymmetric(testdata_laird):
     # Encode text
     encoded_img, _ = decode.encode.gclda_encode(model, "fmri activation")
     assert isinstance(encoded_img, nib.Nifti1Image)
+
+
+def _make_encoding_model(vocabulary):
+    """Build a minimal stand-in for a fitted GCLDAModel, with one topic per vocabulary term."""
+    n_words = len(vocabulary)
+    mask = nib.Nifti1Image(np.ones((2, 2, 2), dtype=np.int8), np.eye(4))
+    return SimpleNamespace(
+        vocabulary=vocabulary,
+        p_topic_g_word_=np.eye(n_words),
+        p_voxel_g_topic_=np.ones((8, n_words)),
+        mask=mask,
+    )
+
+
+def test_gclda_encode_multiword_terms():
+    """Test that multi-word vocabulary terms match text with either separator."""
+    model = _make_encoding_model(["working_memory", "task"])
+
+    _, topic_weights = decode.encode.gclda_encode(model, "working memory task")
+    assert np.array_equal(topic_weights, [1, 1])
+
+    _, topic_weights = decode.encode.gclda_encode(model, "working_memory task")
+    assert np.array_equal(topic_weights, [1, 1])
+
+    # The model's own vocabulary terms, passed as a list
+    _, topic_weights = decode.encode.gclda_encode(model, model.vocabulary)
+    assert np.array_equal(topic_weights, [1, 1])
+
+    # Terms that only differ in separator map to the same n-gram and are both counted
+    model = _make_encoding_model(["working_memory", "task", "working memory"])
+    _, topic_weights = decode.encode.gclda_encode(model, "working memory task")
+    assert np.array_equal(topic_weights, [1, 1, 1])
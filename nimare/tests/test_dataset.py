@@ -49,6 +49,20 @@ def test_dataset_smoke():
     assert isinstance(dset_merged, dataset.Dataset)
 
 
+@pytest.mark.parametrize("compress", [True, False])
+def test_dataset_save_load(testdata_cbma, tmp_path_factory, compress):
+    """Test that a Dataset survives a save/load round trip, with and without compression."""
+    tmpdir = tmp_path_factory.mktemp("test_dataset_save_load")
+    out_file = str(tmpdir / "dset.pkl.gz")
+    testdata_cbma.save(out_file, compress=compress)
+
+    dset = dataset.Dataset.load(out_file, compressed=compress)
+    assert isinstance(dset, nimare.dataset.Dataset)
+    assert dset.ids.tolist() == testdata_cbma.ids.tolist()
+    assert dset.coordinates.equals(testdata_cbma.coordinates)
+    assert dset.metadata.equals(testdata_cbma.metadata)
+
+
 def test_empty_dset():
     """Smoke test for initialization with an empty Dataset."""
     # dictionary with no information
@@ -56,6 +70,41 @@ def test_empty_dset():
     dataset.Dataset(minimal_dict)
 
 
+def test_optional_coordinate_columns():
+    """Test optional coordinate fields that differ in presence and shape across contrasts."""
+    data = {
+        "study-0": {
+            "contrasts": {
+                "1": {"coords": {"space": "MNI", "x": [1, 2], "y": [3, 4], "z": [5, 6]}},
+                "2": {
+                    "coords": {
+                        "space": "MNI",
+                        "x": [7, 8],
+                        "y": [9, 10],
+                        "z": [11, 12],
+                        "z_stat": [2.5, 3.1],
+                    }
+                },
+            }
+        },
+        "study-1": {
+            "contrasts": {
+                "1": {"coords": {"space": "MNI", "x": [0], "y": [0], "z": [0], "p": 0.01}},
+            }
+        },
+    }
+    coords = dataset.Dataset(data).coordinates.set_index("id")
+
+    # Optional fields are stored as strings, with None where a peak lacks a value
+    assert sorted(coords.loc["study-0-2", "z_stat"]) == ["2.5", "3.1"]
+    assert coords.loc["study-0-1", "z_stat"].tolist() == [None, None]
+    assert coords.loc["study-1-1", "z_stat"] is None
+    # Scalar values are broadcast across the contrast's peaks
+    assert coords.loc["study-1-1", "p"] == "0.01"
+    assert coords.loc[["study-0-1", "study-0-2"], "p"].tolist() == [None] * 4
+    assert coords[["x", "y", "z"]].dtypes.eq(np.float64).all()
+
+
 def test_posneg_warning():
     """Smoke test for nimare.dataset.Dataset initialization with positive and negative z_stat."""
     db_file = op.join(get_test_data_path(), "neurosynth_dset.json")
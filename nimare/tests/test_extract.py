@@ -43,3 +43,10 @@ def test_fetch_neuroquery(tmp_path_factory):
     # One set of files found
     assert isinstance(data_files, list)
     assert len(data_files) == 1
+
+
+def test_to_chunks():
+    """Test extract.utils._to_chunks."""
+    chunks = list(nimare.extract.utils._to_chunks(range(7), 3))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(nimare.extract.utils._to_chunks([], 3)) == []
@@ -161,6 +161,14 @@ def test_convert_neurosynth_to_json_smoke():
                 "map_type_conversion": {"univariate-beta map": "beta"},
             }
         ),
+        (
+            {
+                "collection_ids": (6348, 6419),
+                "contrasts": {"action": "action"},
+                "map_type_conversion": {"univariate-beta map": "beta"},
+                "n_cores": -1,
+            }
+        ),
         (
             {
                 "collection_ids": (778,),  # collection not found
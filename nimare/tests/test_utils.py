@@ -5,6 +5,7 @@ import os.path as op
 
 import nibabel as nib
 import numpy as np
+import pandas as pd
 import pytest
 
 from nimare import utils
@@ -167,6 +168,28 @@ def test_mni2tal():
     assert np.allclose(utils.mni2tal(test), true)
 
 
+def test_transform_coordinates_to_space(caplog):
+    """Test nimare.utils._transform_coordinates_to_space with unrecognized and missing spaces."""
+    df = pd.DataFrame(
+        {
+            "x": [-44.0, 20.0, 28.0, 1.0],
+            "y": [31.0, -32.0, -76.0, 2.0],
+            "z": [27.0, 14.0, 28.0, 3.0],
+            "space": ["TAL", "MNI", "dog", None],
+        }
+    )
+    with caplog.at_level(logging.WARNING, logger="nimare.utils"):
+        df = utils._transform_coordinates_to_space(df, None, "mni152_2mm")
+
+    assert "unrecognized space 'dog'" in caplog.text
+    assert "unrecognized space 'None'" in caplog.text
+    xyz = df[["x", "y", "z"]].to_numpy(dtype=float)
+    assert np.allclose(xyz[0], utils.tal2mni(np.array([[-44, 31, 27]])))
+    assert np.allclose(xyz[1:], [[20, -32, 14], [28, -76, 28], [1, 2, 3]])
+    assert df["space"].tolist()[:3] == ["mni152_2mm"] * 3
+    assert df.loc[3, "space"] is None
+
+
 def test_vox2mm():
     """Test vox2mm."""
     test = np.array([[20, 20, 20], [0, 0, 0]])
@@ -183,3 +206,9 @@ def test_mm2vox():
     img = utils.get_template(space="mni152_2mm", mask=None)
     aff = img.affine
     assert np.array_equal(utils.mm2vox(test, aff), true)
+
+
+def test_uk_to_us():
+    """Test nimare.utils._uk_to_us."""
+    assert utils._uk_to_us("the colour of behaviour") == "the color of behavior"
+    assert utils._uk_to_us(None) is None
@@ -7,7 +7,7 @@ import multiprocessing as mp
 import os
 import os.path as op
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 from tempfile import mkstemp
 
 import joblib
@@ -379,47 +379,45 @@ def _dict_to_coordinates(data, masker, space):
     columns = ["id", "study_id", "contrast_id", "x", "y", "z", "space"]
     core_columns = columns.copy()  # Used in contrast for loop
 
-    all_dfs = []
+    # Accumulate each column across contrasts, so that a single DataFrame is built at the end
+    # rather than one (string) array and DataFrame per contrast.
+    column_data = {column: [] for column in columns}
+    n_rows = 0
     for pid in data.keys():
         for expid in data[pid]["contrasts"].keys():
             if "coords" not in data[pid]["contrasts"][expid].keys():
                 continue
 
-            exp_columns = core_columns.copy()
             exp = data[pid]["contrasts"][expid]
 
             # Required info (ids, x, y, z, space)
             n_coords = len(exp["coords"]["x"])
-            rep_id = np.array([[f"{pid}-{expid}", pid, expid]] * n_coords).T
-
-            space_arr = exp["coords"].get("space")
-            space_arr = np.array([space_arr] * n_coords)
-            temp_data = np.vstack(
-                (
-                    rep_id,
-                    np.array(exp["coords"]["x"]),
-                    np.array(exp["coords"]["y"]),
-                    np.array(exp["coords"]["z"]),
-                    space_arr,
-                )
-            )
+            column_data["id"] += [f"{pid}-{expid}"] * n_coords
+            column_data["study_id"] += [pid] * n_coords
+            column_data["contrast_id"] += [expid] * n_coords
+            column_data["x"] += list(exp["coords"]["x"])
+            column_data["y"] += list(exp["coords"]["y"])
+            column_data["z"] += list(exp["coords"]["z"])
+            column_data["space"] += [exp["coords"].get("space")] * n_coords
 
             # Optional information
+            for k in columns[len(core_columns) :]:
+                if k not in exp["coords"].keys():
+                    column_data[k] += [None] * n_coords
+
             for k in list(set(exp["coords"].keys()) - set(core_columns)):
                 k_data = exp["coords"][k]
                 if not isinstance(k_data, list):
-                    k_data = np.array([k_data] * n_coords)
-                exp_columns.append(k)
+                    k_data = [k_data] * n_coords
 
                 if k not in columns:
                     columns.append(k)
-                temp_data = np.vstack((temp_data, k_data))
+                    column_data[k] = [None] * n_rows
+                column_data[k] += list(k_data)
 
-            # Place data in list of dataframes to merge
-            con_df = pd.DataFrame(temp_data.T, columns=exp_columns)
-            all_dfs.append(con_df)
+            n_rows += n_coords
 
-    if not all_dfs:
+    if not n_rows:
         return pd.DataFrame(
             {
                 "id": [],
@@ -432,12 +430,13 @@ def _dict_to_coordinates(data, masker, space):
             },
         )
 
-    df = pd.concat(all_dfs, axis=0, join="outer", sort=False)
-    df = df[columns].reset_index(drop=True)
-    df = df.replace(to_replace="None", value=np.nan)
-    # replace nan with none
-    df = df.where(pd.notnull(df), None)
+    df = pd.DataFrame(column_data, columns=columns, dtype=object)
     df[["x", "y", "z"]] = df[["x", "y", "z"]].astype(float)
+    # Keep the established representation of the other columns: values are strings,
+    # and missing values (or "None") are None.
+    str_columns = [c for c in columns if c not in ("id", "x", "y", "z")]
+    str_df = df[str_columns].astype(str)
+    df[str_columns] = str_df.where(str_df != "None", None)
     df = _transform_coordinates_to_space(df, masker, space)
     return df
 
@@ -467,14 +466,24 @@ def _transform_coordinates_to_space(df, masker, space):
     else:
         raise ValueError(f"Unrecognized space: {space}")
 
-    found_spaces = df["space"].unique()
-    for found_space in found_spaces:
+    # Factorize once so that each space is selected by comparing integer codes,
+    # rather than by comparing strings across the full column.
+    space_codes, found_spaces = pd.factorize(df["space"])
+
+    # Missing spaces are coded as -1 and left out of found_spaces, so warn about them here.
+    # Like other unrecognized spaces, their coordinates are not transformed.
+    for missing_space in df.loc[space_codes == -1, "space"].unique():
+        LGR.warning(
+            f"Not applying transforms to coordinates in unrecognized space '{missing_space}'"
+        )
+
+    for i_space, found_space in enumerate(found_spaces):
         if found_space not in transform.keys():
             LGR.warning(
                 f"Not applying transforms to coordinates in unrecognized space '{found_space}'"
             )
         alg = transform.get(found_space, None)
-        idx = df["space"] == found_space
+        idx = space_codes == i_space
         if alg:
             df.loc[idx, ["x", "y", "z"]] = alg(df.loc[idx, ["x", "y", "z"]].values)
         df.loc[idx, "space"] = space
@@ -621,6 +630,20 @@ def _find_stem(arr):
     return res
 
 
+@lru_cache(maxsize=1)
+def _get_spelling_converter():
+    """Load the UK-to-US spelling dictionary and the pattern matching its UK spellings.
+
+    .. versionadded:: 0.0.13
+
+    The result is cached, because :func:`_uk_to_us` is typically applied element-wise.
+    """
+    spell_df = pd.read_csv(op.join(get_resource_path(), "english_spellings.csv"), index_col="UK")
+    spell_dict = spell_df["US"].to_dict()
+    pattern = re.compile(r"\b(" + "|".join(spell_dict.keys()) + r")\b")
+    return spell_dict, pattern
+
+
 def _uk_to_us(text):
     """Convert UK spellings to US based on a converter.
 
@@ -638,13 +661,10 @@ def _uk_to_us(text):
     -----
     The english_spellings.csv file is from http://www.tysto.com/uk-us-spelling-list.html.
     """
-    SPELL_DF = pd.read_csv(op.join(get_resource_path(), "english_spellings.csv"), index_col="UK")
-    SPELL_DICT = SPELL_DF["US"].to_dict()
-
     if isinstance(text, str):
         # Convert British to American English
-        pattern = re.compile(r"\b(" + "|".join(SPELL_DICT.keys()) + r")\b")
-        text = pattern.sub(lambda x: SPELL_DICT[x.group()], text)
+        spell_dict, pattern = _get_spelling_converter()
+        text = pattern.sub(lambda x: spell_dict[x.group()], text)
     return text
 
 